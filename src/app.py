@@ -4,12 +4,17 @@ import sys
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
-from flask import Flask, request, jsonify
+import hashlib
+import orjson
+from flask import Flask, request, jsonify, Response
+from flask.json.provider import JSONProvider
 from parsers.date_range_parser import DateRangeParser
-from utils.timezone_helper import get_timezone_offset, convert_to_timezone
-import pytz
-from datetime import datetime, timedelta
+from parsers.kernel import compute_ranges
+from utils.timezone_helper import get_timezone, get_timezone_offset, convert_to_timezone
+from datetime import datetime, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfoNotFoundError
 import logging
+import time
 
 # Configure logging for production
 log_level = logging.DEBUG if os.environ.get('DEBUG', 'False').lower() == 'true' else logging.INFO
@@ -19,13 +24,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    orjson serializes/deserializes several times faster than the stdlib
+    json module and handles tz-aware datetime objects natively (RFC 3339,
+    same format as isoformat()), so handlers can put datetimes straight
+    into response dicts.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 date_range_parser = DateRangeParser()
 
+# Monitors poll /health at high frequency; reformatting the timestamp on
+# every poll is wasted work. Cache the string for a second, checked
+# against the monotonic clock. [last_refresh, formatted_timestamp]
+_health_cache = [0.0, '']
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for monitoring."""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.utcnow().isoformat()}), 200
+    mono = time.monotonic()
+    if not _health_cache[1] or mono - _health_cache[0] > 1.0:
+        _health_cache[0] = mono
+        _health_cache[1] = datetime.utcnow().isoformat()
+    return jsonify({'status': 'healthy', 'timestamp': _health_cache[1]}), 200
 
 @app.route('/parse-date-range', methods=['POST'])
 def parse_date_range():
@@ -61,20 +91,21 @@ def parse_date_range():
         
         timezone = data.get('timezone', 'UTC')
         
-        # Validate timezone
+        # Validate and resolve the timezone once; the parser takes the
+        # tzinfo object directly so it does not repeat the lookup.
         try:
-            pytz.timezone(timezone)
-        except pytz.exceptions.UnknownTimeZoneError:
+            tzobj = dt_timezone.utc if timezone == 'UTC' else get_timezone(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
             return jsonify({'error': f'Invalid timezone: {timezone}'}), 400
-        
+
         logger.info(f"Parsing command: '{command}' with timezone: {timezone}")
-        
+
         # Parse the command
-        start, end = date_range_parser.parse_command(command, timezone)
+        start, end = date_range_parser.parse_command(command, tzobj)
         
         response = {
-            'start': start.isoformat(),
-            'end': end.isoformat(),
+            'start': start,  # orjson serializes datetimes directly
+            'end': end,
             'command': command,
             'timezone': timezone,
             'duration_seconds': (end - start).total_seconds()
@@ -91,10 +122,110 @@ def parse_date_range():
         logger.error(f"Unexpected error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
-@app.route('/supported-formats', methods=['GET'])
-def supported_formats():
-    """Return examples of supported date range formats."""
-    examples = {
+@app.route('/parse-date-ranges', methods=['POST'])
+def parse_date_ranges():
+    """
+    Parse a batch of date range commands in a single request.
+
+    Amortizes the per-request framework overhead (routing, JSON decode,
+    timezone validation, 'now' snapshot) across the whole batch.
+
+    Expected JSON payload:
+    {
+        "commands": ["last 3 hours", "yesterday"],
+        "timezone": "UTC"  // optional, defaults to UTC, shared by the batch
+    }
+
+    Returns:
+    {
+        "results": [
+            {"command": "...", "start": "...", "end": "...", "duration_seconds": ...},
+            {"command": "...", "error": "..."}   // per-command failures
+        ],
+        "timezone": "UTC"
+    }
+    """
+    try:
+        # Validate request
+        if not request.is_json:
+            return jsonify({'error': 'Request must be JSON'}), 400
+
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'No JSON data provided'}), 400
+
+        commands = data.get('commands')
+        if not commands or not isinstance(commands, list):
+            return jsonify({'error': 'Missing required field: commands'}), 400
+
+        timezone = data.get('timezone', 'UTC')
+
+        # Validate and resolve the timezone once for the whole batch
+        try:
+            local_tz = dt_timezone.utc if timezone == 'UTC' else get_timezone(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            return jsonify({'error': f'Invalid timezone: {timezone}'}), 400
+
+        logger.info(f"Parsing batch of {len(commands)} commands with timezone: {timezone}")
+
+        # One 'now' snapshot keeps all ranges in the batch consistent
+        now = datetime.now(local_tz)
+        results = [None] * len(commands)
+
+        # Phase 1: peel off commands that reduce to fixed-length offsets
+        # and push them through the bulk kernel in a single pass.
+        kernel_triples = []
+        kernel_slots = []
+        for i, command in enumerate(commands):
+            try:
+                triple = date_range_parser._extract_offset_triple(command)
+            except Exception:
+                triple = None
+            if triple is not None:
+                kernel_triples.append(triple)
+                kernel_slots.append(i)
+
+        if kernel_triples:
+            ranges = compute_ranges(now.timestamp(), kernel_triples)
+            for slot, (start_ts, end_ts) in zip(kernel_slots, ranges):
+                try:
+                    results[slot] = {
+                        'command': commands[slot],
+                        'start': datetime.fromtimestamp(start_ts, local_tz),
+                        'end': datetime.fromtimestamp(end_ts, local_tz),
+                        'duration_seconds': end_ts - start_ts
+                    }
+                except (ValueError, OverflowError, OSError):
+                    # Overflow-sized offsets can't be represented as
+                    # datetimes; leave the slot to phase 2, which reports
+                    # the per-command error instead of failing the batch.
+                    results[slot] = None
+
+        # Phase 2: everything else takes the regular parse path.
+        for i, command in enumerate(commands):
+            if results[i] is None:
+                try:
+                    start, end = date_range_parser._parse_with_now(command, now, local_tz)
+                    results[i] = {
+                        'command': command,
+                        'start': start,
+                        'end': end,
+                        'duration_seconds': (end - start).total_seconds()
+                    }
+                except ValueError as e:
+                    results[i] = {'command': command, 'error': str(e)}
+
+        return jsonify({'results': results, 'timezone': timezone}), 200
+
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+# The /supported-formats payload is static, so serialize it once at import
+# and serve the cached bytes instead of rebuilding the dict and re-encoding
+# JSON on every request.
+_SUPPORTED_FORMATS_BODY = orjson.dumps({
+    'supported_formats': {
         "simple_durations": [
             "1 day", "2 days", "3 hours", "30 minutes", "45 seconds",
             "half hour", "quarter day", "a week", "an hour"
@@ -122,13 +253,24 @@ def supported_formats():
         "abbreviations": [
             "1 sec", "2 mins", "3 hrs", "4 wks", "5 mos", "6 yrs"
         ]
-    }
-    
-    return jsonify({
-        'supported_formats': examples,
-        'supported_timezones': 'All pytz timezones (e.g., UTC, America/New_York, Europe/London)',
-        'note': 'Commands are case-insensitive and support various aliases'
-    }), 200
+    },
+    'supported_timezones': 'All IANA timezones (e.g., UTC, America/New_York, Europe/London)',
+    'note': 'Commands are case-insensitive and support various aliases'
+})
+_SUPPORTED_FORMATS_ETAG = f'"{hashlib.md5(_SUPPORTED_FORMATS_BODY).hexdigest()}"'
+
+@app.route('/supported-formats', methods=['GET'])
+def supported_formats():
+    """Return examples of supported date range formats."""
+    return Response(
+        _SUPPORTED_FORMATS_BODY,
+        status=200,
+        mimetype='application/json',
+        headers={
+            'Cache-Control': 'public, max-age=86400',
+            'ETag': _SUPPORTED_FORMATS_ETAG,
+        },
+    )
 
 @app.errorhandler(404)
 def not_found(error):
@@ -144,5 +286,6 @@ if __name__ == '__main__':
     
     logger.info(f"Starting Date Range Parser Server on port {port}")
     logger.info(f"Debug mode: {debug}")
-    
+    logger.warning("Running the Flask dev server; use gunicorn via wsgi.py in production")
+
     app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
@@ -1,324 +1,489 @@
+import functools
 import re
-import pytz
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
 from dateutil import parser as dateutil_parser
 from dateutil.relativedelta import relativedelta
 
+# Common filler words stripped during normalization; frozenset gives O(1)
+# membership versus scanning a list for every word.
+_FILLER_WORDS = frozenset(('the', 'for', 'of', 'in', 'at', 'on', 'from', 'to', 'and', 'or'))
+
+# Fixed-length units expressed in seconds. Lets _build_range compute the
+# range endpoint with plain epoch arithmetic instead of allocating a
+# timedelta; months/years stay on relativedelta since they are variable.
+_UNIT_SECONDS = {
+    'seconds': 1,
+    'minutes': 60,
+    'hours': 3600,
+    'days': 86400,
+    'weeks': 604800,
+}
+
+# Time unit mappings with various aliases
+_TIME_UNITS = {
+    # Seconds
+    'second': 'seconds', 'seconds': 'seconds', 'sec': 'seconds', 'secs': 'seconds', 's': 'seconds',
+    # Minutes
+    'minute': 'minutes', 'minutes': 'minutes', 'min': 'minutes', 'mins': 'minutes', 'm': 'minutes',
+    # Hours
+    'hour': 'hours', 'hours': 'hours', 'hr': 'hours', 'hrs': 'hours', 'h': 'hours',
+    # Days
+    'day': 'days', 'days': 'days', 'd': 'days',
+    # Weeks
+    'week': 'weeks', 'weeks': 'weeks', 'wk': 'weeks', 'wks': 'weeks', 'w': 'weeks',
+    # Months
+    'month': 'months', 'months': 'months', 'mon': 'months', 'mons': 'months', 'mo': 'months',
+    # Years
+    'year': 'years', 'years': 'years', 'yr': 'years', 'yrs': 'years', 'y': 'years',
+}
+
+# Number word mappings
+_NUMBER_WORDS = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
+    'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
+    'thirty': 30, 'forty': 40, 'fifty': 50, 'sixty': 60, 'seventy': 70,
+    'eighty': 80, 'ninety': 90, 'hundred': 100, 'thousand': 1000,
+    'a': 1, 'an': 1, 'half': 0.5, 'quarter': 0.25, 'dozen': 12
+}
+
+# Precompute compound number words ('twenty one' .. 'ninety nine') so
+# _parse_number stays a single dict lookup for word input instead of
+# splitting and summing at parse time.
+_NUMBER_WORDS.update({
+    f'{t} {o}': _NUMBER_WORDS[t] + _NUMBER_WORDS[o]
+    for t in ('twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety')
+    for o in ('one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine')
+})
+
+# Relative time keywords
+_RELATIVE_KEYWORDS = {
+    'last': -1, 'past': -1, 'previous': -1, 'ago': -1, 'before': -1,
+    'next': 1, 'upcoming': 1, 'following': 1, 'forward': 1, 'ahead': 1,
+    'this': 0, 'current': 0, 'today': 0, 'now': 0
+}
+
+# Hashed unit dispatch for _create_timedelta; replaces a linear if/elif
+# ladder in the hot path.
+_TD_BUILDERS = {
+    'seconds': lambda a: timedelta(seconds=a),
+    'minutes': lambda a: timedelta(minutes=a),
+    'hours': lambda a: timedelta(hours=a),
+    'days': lambda a: timedelta(days=a),
+    'weeks': lambda a: timedelta(weeks=a),
+    'months': lambda a: relativedelta(months=int(a)),
+    'years': lambda a: relativedelta(years=int(a)),
+}
+
+# Every parseable command contains at least one of these tokens, so garbage
+# input can be rejected with one set-membership sweep instead of running
+# the full strategy scan.
+_KNOWN_TOKENS = (
+    frozenset(_TIME_UNITS)
+    | frozenset(_RELATIVE_KEYWORDS)
+    | frozenset(_NUMBER_WORDS)
+    | {'yesterday', 'today', 'tomorrow', 'since', 'until',
+       'from', 'between', 'week', 'month', 'year', 'quarter', 'ago', 'in'}
+)
+
+@functools.lru_cache(maxsize=512)
+def _get_tz(name):
+    """Resolve a timezone name to a tzinfo object, caching the lookup.
+
+    zoneinfo.ZoneInfo instances are interned by CPython, but the cache
+    here also skips the constructor call itself for repeated zones
+    (UTC, America/New_York) that dominate real traffic. Unknown names
+    raise zoneinfo.ZoneInfoNotFoundError.
+    """
+    return ZoneInfo(name)
+
 class DateRangeParser:
+    """Parses natural-language date range commands.
+
+    The immutable vocabulary tables (units, number words, keywords) live
+    at module level and are shared across instances; only compiled
+    patterns, dispatch tables of bound methods and cache state stay on
+    the instance.
+    """
+
     def __init__(self):
-        # Time unit mappings with various aliases
-        self.time_units = {
-            # Seconds
-            'second': 'seconds', 'seconds': 'seconds', 'sec': 'seconds', 'secs': 'seconds', 's': 'seconds',
-            # Minutes
-            'minute': 'minutes', 'minutes': 'minutes', 'min': 'minutes', 'mins': 'minutes', 'm': 'minutes',
-            # Hours
-            'hour': 'hours', 'hours': 'hours', 'hr': 'hours', 'hrs': 'hours', 'h': 'hours',
-            # Days
-            'day': 'days', 'days': 'days', 'd': 'days',
-            # Weeks
-            'week': 'weeks', 'weeks': 'weeks', 'wk': 'weeks', 'wks': 'weeks', 'w': 'weeks',
-            # Months
-            'month': 'months', 'months': 'months', 'mon': 'months', 'mons': 'months', 'mo': 'months',
-            # Years
-            'year': 'years', 'years': 'years', 'yr': 'years', 'yrs': 'years', 'y': 'years',
+        # Single compiled alternation covering every parsing strategy.
+        # One scan of the command replaces the old cascade of per-strategy
+        # regexes; m.lastgroup tells us which strategy matched and
+        # self._dispatch maps it to the handler. Alternative order matters
+        # at a given position: the generic anchored duration pattern goes
+        # last so it cannot shadow the more specific strategies.
+        self._master_re = re.compile(
+            r'(?P<relative>(?P<rel_dir>last|past|previous|next|upcoming|following)'
+            r'\s+(?P<rel_num>\d+|\w+)\s+(?P<rel_unit>\w+))'
+            r'|(?P<ago>(?P<ago_num>\d+|\w+)\s+(?P<ago_unit>\w+)'
+            r'\s+(?P<ago_dir>ago|before|ahead|forward))'
+            r'|(?P<in_>in\s+(?P<in_num>\d+|\w+)\s+(?P<in_unit>\w+))'
+            r'|(?P<named>yesterday|today|now|tomorrow)'
+            r'|(?P<calendar>(?P<cal_dir>this|last|next|current|past|previous)'
+            r'\s+(?P<cal_period>week|month|year|quarter))'
+            r'|(?P<duration>^(?P<dur_num>\d+(?:\.\d+)?|\w+)\s+(?P<dur_unit>\w+)$)'
+        )
+        self._dispatch = {
+            'relative': self._handle_relative,
+            'ago': self._handle_ago,
+            'in_': self._handle_in,
+            'named': self._handle_named,
+            'calendar': self._handle_calendar,
+            'duration': self._handle_duration,
         }
-        
-        # Number word mappings
-        self.number_words = {
-            'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-            'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-            'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
-            'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
-            'thirty': 30, 'forty': 40, 'fifty': 50, 'sixty': 60, 'seventy': 70,
-            'eighty': 80, 'ninety': 90, 'hundred': 100, 'thousand': 1000,
-            'a': 1, 'an': 1, 'half': 0.5, 'quarter': 0.25, 'dozen': 12
+        self._contractions_re = re.compile(r"n't|'s|'re")
+        self._contractions = {"n't": " not", "'s": "", "'re": " are"}
+
+        # Hashed dispatch tables: named-period words and calendar periods
+        # resolve straight to their handlers instead of walking if/elif
+        # chains on every call.
+        self._named_period_handlers = {
+            'yesterday': self._period_yesterday,
+            'today': self._period_today,
+            'now': self._period_today,
+            'tomorrow': self._period_tomorrow,
         }
-        
-        # Relative time keywords
-        self.relative_keywords = {
-            'last': -1, 'past': -1, 'previous': -1, 'ago': -1, 'before': -1,
-            'next': 1, 'upcoming': 1, 'following': 1, 'forward': 1, 'ahead': 1,
-            'this': 0, 'current': 0, 'today': 0, 'now': 0
+        self._calendar_handlers = {
+            'week': self._calendar_week,
+            'month': self._calendar_month,
         }
 
-    def parse_command(self, command: str, timezone: str = 'UTC'):
-        """Parse date range commands and return start and end datetime objects."""
+        # Memoize full parse results per (command, timezone, time bucket):
+        # workloads tend to repeat the same handful of commands, and within
+        # one bucket the answer is identical, so repeats skip the whole
+        # parse pipeline. Widen/narrow _cache_bucket_seconds to trade
+        # staleness for hit rate. Per-instance so caches die with the parser.
+        self._cache_bucket_seconds = 60
+        self._cached_parse = functools.lru_cache(maxsize=1024)(self._parse_bucketed)
+
+    def parse_command(self, command: str, timezone='UTC'):
+        """Parse date range commands and return start and end datetime objects.
+
+        timezone may be an IANA zone name or an already-resolved tzinfo
+        object; callers that validate the zone up front (like the request
+        handlers) pass the tzinfo through to avoid a second lookup.
+        """
+        # Parser failures surface as ValueError, including bad input types;
+        # the check must come before the cache-bypass lower() calls below.
+        if not isinstance(command, str):
+            raise ValueError(f"Error parsing command '{command}': command must be a string")
+
+        # Commands anchored to the current instant drift sub-minute, so
+        # serving them from a bucketed cache would return stale 'now's.
+        if 'now' in command.lower() or 'today' in command.lower():
+            return self._parse_uncached(command, timezone)
+
+        bucket = int(time.time() // self._cache_bucket_seconds)
+        return self._cached_parse(command, timezone, bucket)
+
+    def _parse_bucketed(self, command, timezone, bucket):
+        # The bucket argument only serves to expire cache entries.
+        return self._parse_uncached(command, timezone)
+
+    def _parse_uncached(self, command, timezone):
         try:
-            # Get the current time in the specified timezone
-            local_tz = pytz.timezone(timezone)
+            # Get the current time in the specified timezone. UTC is by far
+            # the most common case and needs no zoneinfo lookup at all: the
+            # fixed stdlib tzinfo skips the localize machinery entirely.
+            if not isinstance(timezone, str):
+                local_tz = timezone  # already a tzinfo object
+            elif timezone == 'UTC':
+                local_tz = dt_timezone.utc
+            else:
+                local_tz = _get_tz(timezone)
             now = datetime.now(local_tz)
-            
+        except Exception as e:
+            raise ValueError(f"Error parsing command '{command}': {str(e)}")
+
+        return self._parse_with_now(command, now, local_tz)
+
+    def _parse_with_now(self, command, now, local_tz):
+        """Parse a command against a fixed reference time.
+
+        Lets the batch endpoint share one timezone lookup and one 'now'
+        snapshot across many commands instead of redoing both per call.
+        """
+        # Batch entries arrive here directly, without going through the
+        # guard in parse_command, so repeat it for the same clean error.
+        if not isinstance(command, str):
+            raise ValueError(f"Error parsing command '{command}': command must be a string")
+
+        try:
             # Clean and normalize the command
             command = self._normalize_command(command.lower().strip())
-            
+
             # Try different parsing strategies
             result = self._try_parse_strategies(command, now, local_tz)
-            
+
             if result:
                 return result
             else:
                 raise ValueError(f"Unable to parse command: {command}")
-                
+
         except Exception as e:
             raise ValueError(f"Error parsing command '{command}': {str(e)}")
 
     def _normalize_command(self, command):
         """Normalize the command by removing unnecessary words and standardizing format."""
-        # Remove common filler words
-        filler_words = ['the', 'for', 'of', 'in', 'at', 'on', 'from', 'to', 'and', 'or']
+        # Remove common filler words (kept when the command is too short to
+        # survive the stripping)
         words = command.split()
-        words = [word for word in words if word not in filler_words or len(words) <= 2]
-        
+        if len(words) > 2:
+            words = [word for word in words if word not in _FILLER_WORDS]
+
+
         # Handle contractions and common abbreviations
         command = ' '.join(words)
-        command = re.sub(r"n't", " not", command)
-        command = re.sub(r"'s", "", command)
-        command = re.sub(r"'re", " are", command)
-        
+        command = self._contractions_re.sub(lambda m: self._contractions[m.group()], command)
+
         return command
 
     def _try_parse_strategies(self, command, now, local_tz):
-        """Try different parsing strategies in order of specificity."""
-        
-        # Strategy 1: Relative time expressions (last X, next X, X ago)
-        result = self._parse_relative_time(command, now, local_tz)
-        if result: return result
-        
-        # Strategy 2: Simple time duration (X days, X hours)
-        result = self._parse_simple_duration(command, now, local_tz)
-        if result: return result
-        
-        # Strategy 3: Named periods (yesterday, today, tomorrow)
-        result = self._parse_named_periods(command, now, local_tz)
-        if result: return result
-        
-        # Strategy 4: Calendar periods (this week, last month)
-        result = self._parse_calendar_periods(command, now, local_tz)
-        if result: return result
-        
-        return None
+        """Scan the command with the master pattern and dispatch on the match.
 
-    def _parse_relative_time(self, command, now, local_tz):
-        """Parse relative time expressions like 'last 3 hours', 'next week', '2 days ago'."""
-        
-        # Pattern for "last/past/next X Y" or "X Y ago/ahead"
-        patterns = [
-            r'(last|past|previous)\s+(\d+|\w+)\s+(\w+)',
-            r'(next|upcoming|following)\s+(\d+|\w+)\s+(\w+)',
-            r'(\d+|\w+)\s+(\w+)\s+(ago|before)',
-            r'in\s+(\d+|\w+)\s+(\w+)',
-            r'(\d+|\w+)\s+(\w+)\s+(ahead|forward)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, command)
-            if match:
-                if len(match.groups()) == 3:
-                    if match.group(3) in ['ago', 'before']:
-                        # "X Y ago"
-                        number_str, unit_str = match.group(1), match.group(2)
-                        direction = -1
-                    elif match.group(3) in ['ahead', 'forward']:
-                        # "X Y ahead"
-                        number_str, unit_str = match.group(1), match.group(2)
-                        direction = 1
-                    else:
-                        # "last/next X Y"
-                        direction_str, number_str, unit_str = match.groups()
-                        direction = self.relative_keywords.get(direction_str, -1)
-                elif len(match.groups()) == 2:
-                    # "in X Y"
-                    number_str, unit_str = match.groups()
-                    direction = 1
-                else:
-                    continue
-                
-                try:
-                    number = self._parse_number(number_str)
-                    unit = self._normalize_time_unit(unit_str)
-                    
-                    if unit and number is not None:
-                        delta = self._create_timedelta(number * direction, unit)
-                        if direction < 0:
-                            start_date = now + delta
-                            end_date = now
-                        else:
-                            start_date = now
-                            end_date = now + delta
-                        return start_date, end_date
-                except:
-                    continue
-        
-        return None
+        A single alternation scan replaces the old strategy cascade. If a
+        handler cannot make sense of its match (e.g. the generic duration
+        pattern caught a non-number word), scanning resumes at the next
+        token boundary so less specific matches further along still get
+        a chance.
+        """
+        # Fast reject: commands without a single known token can never
+        # parse, so skip the regex scan entirely. The rstrip mirrors the
+        # plural handling in _normalize_time_unit ('mos' -> 'mo').
+        known = _KNOWN_TOKENS
+        if not any(word in known or word.rstrip('s') in known
+                   for word in command.split()):
+            return None
 
-    def _parse_simple_duration(self, command, now, local_tz):
-        """Parse simple duration expressions like '3 days', 'half hour', 'a week'."""
-        
-        # Pattern for "number unit" or "a/an unit"
-        patterns = [
-            r'^(\d+(?:\.\d+)?)\s+(\w+)$',
-            r'^(a|an|one|half|quarter)\s+(\w+)$',
-            r'^(\w+)\s+(\w+)$',  # For written numbers
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, command)
-            if match:
-                number_str, unit_str = match.groups()
-                try:
-                    number = self._parse_number(number_str)
-                    unit = self._normalize_time_unit(unit_str)
-                    
-                    if unit and number is not None:
-                        delta = self._create_timedelta(-number, unit)  # Default to past
-                        start_date = now + delta
-                        end_date = now
-                        return start_date, end_date
-                except:
-                    continue
-        
-        return None
+        pos = 0
+        while True:
+            match = self._master_re.search(command, pos)
+            if not match:
+                return None
+            result = self._dispatch[match.lastgroup](match, now, local_tz)
+            if result:
+                return result
+            # Resume at the next token boundary: resuming one character
+            # later would let the numeric patterns re-match inside a digit
+            # run (e.g. the tail of an overflow-sized number) and fabricate
+            # a range instead of rejecting the command.
+            next_space = command.find(' ', match.start())
+            if next_space == -1:
+                return None
+            pos = next_space + 1
 
-    def _parse_named_periods(self, command, now, local_tz):
-        """Parse named periods like 'yesterday', 'today', 'tomorrow'."""
-        
-        if 'yesterday' in command:
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-            end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999) - timedelta(days=1)
-            return start_date, end_date
-        
-        elif 'today' in command or 'now' in command:
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = now
-            return start_date, end_date
-        
-        elif 'tomorrow' in command:
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999) + timedelta(days=1)
-            return start_date, end_date
-        
+    def _handle_relative(self, match, now, local_tz):
+        """Handle 'last/past/next X Y' style expressions."""
+        direction = _RELATIVE_KEYWORDS.get(match.group('rel_dir'), -1)
+        return self._build_range(match.group('rel_num'), match.group('rel_unit'), direction, now)
+
+    def _handle_ago(self, match, now, local_tz):
+        """Handle 'X Y ago/before/ahead/forward' style expressions."""
+        direction = -1 if match.group('ago_dir') in ['ago', 'before'] else 1
+        return self._build_range(match.group('ago_num'), match.group('ago_unit'), direction, now)
+
+    def _handle_in(self, match, now, local_tz):
+        """Handle 'in X Y' style expressions."""
+        return self._build_range(match.group('in_num'), match.group('in_unit'), 1, now)
+
+    def _handle_duration(self, match, now, local_tz):
+        """Handle bare 'X Y' durations like '3 days'; defaults to the past."""
+        return self._build_range(match.group('dur_num'), match.group('dur_unit'), -1, now)
+
+    def _handle_named(self, match, now, local_tz):
+        """Handle named periods like 'yesterday', 'today', 'tomorrow'."""
+        handler = self._named_period_handlers.get(match.group('named'))
+        if handler:
+            return handler(now)
         return None
 
-    def _parse_calendar_periods(self, command, now, local_tz):
-        """Parse calendar periods like 'this week', 'last month', 'next year'."""
-        
-        patterns = [
-            r'(this|last|next|current|past|previous)\s+(week|month|year|quarter)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, command)
-            if match:
-                direction_str, period = match.groups()
-                direction = self.relative_keywords.get(direction_str, 0)
-                
-                try:
-                    return self._get_calendar_period(now, period, direction)
-                except:
-                    continue
-        
+    def _period_yesterday(self, now):
+        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+        end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999) - timedelta(days=1)
+        return start_date, end_date
+
+    def _period_today(self, now):
+        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = now
+        return start_date, end_date
+
+    def _period_tomorrow(self, now):
+        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999) + timedelta(days=1)
+        return start_date, end_date
+
+    def _handle_calendar(self, match, now, local_tz):
+        """Handle calendar periods like 'this week', 'last month', 'next year'."""
+        direction = _RELATIVE_KEYWORDS.get(match.group('cal_dir'), 0)
+
+        try:
+            return self._get_calendar_period(now, match.group('cal_period'), direction)
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+    def _extract_offset_triple(self, command):
+        """Reduce a command to (amount, unit_seconds, direction) if possible.
+
+        Feeds the bulk kernel used by the batch endpoint. Only plain
+        fixed-length offset expressions qualify; calendar periods, named
+        days and month/year arithmetic return None and take the regular
+        strategy scan instead.
+        """
+        command = self._normalize_command(command.lower().strip())
+        match = self._master_re.search(command)
+        if not match:
+            return None
+
+        group = match.lastgroup
+        if group == 'relative':
+            direction = _RELATIVE_KEYWORDS.get(match.group('rel_dir'), -1)
+            number_str, unit_str = match.group('rel_num'), match.group('rel_unit')
+        elif group == 'ago':
+            direction = -1 if match.group('ago_dir') in ['ago', 'before'] else 1
+            number_str, unit_str = match.group('ago_num'), match.group('ago_unit')
+        elif group == 'in_':
+            direction = 1
+            number_str, unit_str = match.group('in_num'), match.group('in_unit')
+        elif group == 'duration':
+            direction = -1
+            number_str, unit_str = match.group('dur_num'), match.group('dur_unit')
+        else:
+            return None
+
+        number = self._parse_number(number_str)
+        unit = self._normalize_time_unit(unit_str)
+        if number is None or unit not in _UNIT_SECONDS:
+            return None
+
+        return number, _UNIT_SECONDS[unit], direction
+
+    def _build_range(self, number_str, unit_str, direction, now):
+        """Turn a (number, unit, direction) triple into a (start, end) range."""
+        try:
+            number = self._parse_number(number_str)
+            unit = self._normalize_time_unit(unit_str)
+
+            if unit and number is not None:
+                unit_sec = _UNIT_SECONDS.get(unit)
+                if unit_sec is not None:
+                    # Fast path: fixed-length units need no timedelta, just
+                    # an epoch offset re-attached to the same timezone.
+                    other = datetime.fromtimestamp(
+                        now.timestamp() + number * direction * unit_sec, now.tzinfo)
+                else:
+                    other = now + self._create_timedelta(number * direction, unit)
+
+                if direction < 0:
+                    return other, now
+                else:
+                    return now, other
+        except (ValueError, TypeError, OverflowError, OSError):
+            # Out-of-range amounts (fromtimestamp overflow) or unit
+            # mismatches just mean this match was not a usable range.
+            pass
+
         return None
 
     def _parse_number(self, number_str):
         """Parse various number representations including words and fractions."""
-        
-        # Try direct number conversion
-        try:
-            return float(number_str)
-        except ValueError:
-            pass
-        
-        # Try number words
-        if number_str in self.number_words:
-            return self.number_words[number_str]
-        
+
+        # Word lookup first: a dict hit is far cheaper than the exception
+        # machinery float() triggers on non-numeric input.
+        value = _NUMBER_WORDS.get(number_str)
+        if value is not None:
+            return value
+
+        # Only attempt float conversion when it can plausibly succeed
+        if number_str[:1].isdigit() or number_str[:1] == '.':
+            try:
+                return float(number_str)
+            except ValueError:
+                return None
+
         return None
 
     def _normalize_time_unit(self, unit_str):
         """Normalize time unit to standard form."""
         unit_str = unit_str.lower().rstrip('s')  # Remove plural 's'
-        return self.time_units.get(unit_str)
+        return _TIME_UNITS.get(unit_str)
 
     def _create_timedelta(self, amount, unit):
         """Create timedelta object based on amount and unit."""
-        
-        if unit == 'seconds':
-            return timedelta(seconds=amount)
-        elif unit == 'minutes':
-            return timedelta(minutes=amount)
-        elif unit == 'hours':
-            return timedelta(hours=amount)
-        elif unit == 'days':
-            return timedelta(days=amount)
-        elif unit == 'weeks':
-            return timedelta(weeks=amount)
-        elif unit == 'months':
-            return relativedelta(months=int(amount))
-        elif unit == 'years':
-            return relativedelta(years=int(amount))
-        else:
+        builder = _TD_BUILDERS.get(unit)
+        if builder is None:
             raise ValueError(f"Unknown time unit: {unit}")
+        return builder(amount)
 
     def _get_calendar_period(self, now, period, direction):
         """Get start and end dates for calendar periods."""
-        
-        if period == 'week':
-            # Get start of week (Monday)
-            days_since_monday = now.weekday()
-            start_of_week = now - timedelta(days=days_since_monday)
-            start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-            
-            if direction == 0:  # this week
-                start_date = start_of_week
-                end_date = now
-            elif direction < 0:  # last week
-                start_date = start_of_week - timedelta(weeks=1)
-                end_date = start_of_week - timedelta(microseconds=1)
-            else:  # next week
-                start_date = start_of_week + timedelta(weeks=1)
-                end_date = start_of_week + timedelta(weeks=2) - timedelta(microseconds=1)
-            
-            return start_date, end_date
-        
-        elif period == 'month':
-            if direction == 0:  # this month
-                start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                end_date = now
-            elif direction < 0:  # last month
-                start_date = (now.replace(day=1) - relativedelta(months=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = now.replace(day=1) - timedelta(microseconds=1)
-            else:  # next month
-                start_date = (now.replace(day=1) + relativedelta(months=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = (now.replace(day=1) + relativedelta(months=2)) - timedelta(microseconds=1)
-            
-            return start_date, end_date
-        
-        return None
+        handler = self._calendar_handlers.get(period)
+        if handler is None:
+            return None
+        return handler(now, direction)
+
+    def _calendar_week(self, now, direction):
+        # Get start of week (Monday)
+        days_since_monday = now.weekday()
+        start_of_week = now - timedelta(days=days_since_monday)
+        start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        if direction == 0:  # this week
+            start_date = start_of_week
+            end_date = now
+        elif direction < 0:  # last week
+            start_date = start_of_week - timedelta(weeks=1)
+            end_date = start_of_week - timedelta(microseconds=1)
+        else:  # next week
+            start_date = start_of_week + timedelta(weeks=1)
+            end_date = start_of_week + timedelta(weeks=2) - timedelta(microseconds=1)
+
+        return start_date, end_date
+
+    def _calendar_month(self, now, direction):
+        if direction == 0:  # this month
+            start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            end_date = now
+        elif direction < 0:  # last month
+            start_date = (now.replace(day=1) - relativedelta(months=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            end_date = now.replace(day=1) - timedelta(microseconds=1)
+        else:  # next month
+            start_date = (now.replace(day=1) + relativedelta(months=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            end_date = (now.replace(day=1) + relativedelta(months=2)) - timedelta(microseconds=1)
+
+        return start_date, end_date
 
     def _parse_flexible_date(self, date_str, now, local_tz):
-        """Parse flexible date strings using dateutil and custom logic."""
-        
+        """Parse flexible date strings using dateutil and custom logic.
+
+        Returns None when the string cannot be parsed; only the outermost
+        parse_command turns failures into ValueError.
+        """
+
         # Try dateutil parser first
         try:
             parsed = dateutil_parser.parse(date_str, default=now)
             if parsed.tzinfo is None:
-                parsed = local_tz.localize(parsed)
+                parsed = parsed.replace(tzinfo=local_tz)
             return parsed
-        except:
+        except (ValueError, TypeError, OverflowError):
             pass
         
         # Try our custom named period parsing
-        if date_str in ['yesterday']:
-            return now - timedelta(days=1)
-        elif date_str in ['today', 'now']:
-            return now
-        elif date_str in ['tomorrow']:
-            return now + timedelta(days=1)
+        match date_str:
+            case 'yesterday':
+                return now - timedelta(days=1)
+            case 'today' | 'now':
+                return now
+            case 'tomorrow':
+                return now + timedelta(days=1)
         
         # Try relative parsing
-        temp_result = self._parse_relative_time(date_str, now, local_tz)
+        temp_result = self._try_parse_strategies(date_str, now, local_tz)
         if temp_result:
             return temp_result[0]  # Return start date
-        
-        raise ValueError(f"Cannot parse date: {date_str}")
\ No newline at end of file
+
+        return None
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""Bulk date-range arithmetic kernel for the batch endpoint.
+
+Computes (start_ts, end_ts) epoch pairs for many (amount, unit_seconds,
+direction) triples in one pass. When numba and numpy are installed the
+loop is JIT-compiled over float64 arrays and runs at close to C speed
+across cores; otherwise a pure Python fallback keeps the batch path
+working without the optional dependency.
+
+Amounts are float64 rather than int64 so fractional commands like
+'half hour' stay exact.
+"""
+
+try:
+    import numpy as np
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def _compute_ranges_jit(now_ts, amounts, unit_secs, directions, out_starts, out_ends):
+        for i in prange(amounts.shape[0]):
+            offset = amounts[i] * unit_secs[i] * directions[i]
+            if directions[i] < 0:
+                out_starts[i] = now_ts + offset
+                out_ends[i] = now_ts
+            else:
+                out_starts[i] = now_ts
+                out_ends[i] = now_ts + offset
+
+    def compute_ranges(now_ts, triples):
+        """Return [(start_ts, end_ts), ...] for (amount, unit_seconds, direction) triples."""
+        amounts = np.array([t[0] for t in triples], dtype=np.float64)
+        unit_secs = np.array([t[1] for t in triples], dtype=np.float64)
+        directions = np.array([t[2] for t in triples], dtype=np.float64)
+        out_starts = np.empty_like(amounts)
+        out_ends = np.empty_like(amounts)
+        _compute_ranges_jit(now_ts, amounts, unit_secs, directions, out_starts, out_ends)
+        return list(zip(out_starts.tolist(), out_ends.tolist()))
+
+except ImportError:
+    def compute_ranges(now_ts, triples):
+        """Pure-Python fallback used when numba/numpy are not installed."""
+        results = []
+        for amount, unit_sec, direction in triples:
+            offset = amount * unit_sec * direction
+            if direction < 0:
+                results.append((now_ts + offset, now_ts))
+            else:
+                results.append((now_ts, now_ts + offset))
+        return results
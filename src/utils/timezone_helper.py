@@ -1,10 +1,20 @@
+import functools
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
+
+@functools.lru_cache(maxsize=512)
+def get_timezone(timezone):
+    """Resolve a timezone name to a tzinfo object, caching the lookup.
+
+    Since there are only ~600 IANA zones the cache is effectively
+    unbounded. Unknown names raise zoneinfo.ZoneInfoNotFoundError.
+    """
+    return ZoneInfo(timezone)
 
 def get_timezone_offset(timezone):
-    tz = pytz.timezone(timezone)
+    tz = get_timezone(timezone)
     return tz.utcoffset(datetime.now()).total_seconds() / 3600
 
 def convert_to_timezone(dt, timezone):
-    tz = pytz.timezone(timezone)
+    tz = get_timezone(timezone)
     return dt.astimezone(tz)
\ No newline at end of file
@@ -1,7 +1,6 @@
 import pytest
 from src.parsers.date_range_parser import DateRangeParser
 from datetime import datetime, timedelta
-import pytz
 
 @pytest.fixture
 def date_range_parser():
@@ -112,6 +111,18 @@ class TestErrorHandling:
         with pytest.raises(ValueError):
             date_range_parser.parse_command("1 day", "Invalid/Timezone")
 
+    def test_overflow_numbers(self, date_range_parser):
+        # Overflow-sized but well-formed numbers must be rejected, not
+        # partially re-matched as a smaller number further into the digits
+        commands = [
+            "999999999999999 years ago",
+            "1000000000000 minutes ago",
+            "xtwenty minutes ago",
+        ]
+        for command in commands:
+            with pytest.raises(ValueError):
+                date_range_parser.parse_command(command, "UTC")
+
 class TestEdgeCases:
     def test_case_insensitive(self, date_range_parser):
         commands = ["LAST 3 HOURS", "Next Week", "YeStErDaY"]
@@ -0,0 +1,12 @@
+"""WSGI entry point for production servers.
+
+The Flask dev server in src/app.py is single-threaded and only meant for
+local testing. In production, run the app under gunicorn so request
+handling scales with cores:
+
+    gunicorn -w $(nproc) -k gthread --threads 4 --preload -b 0.0.0.0:5000 wsgi:application
+
+--preload initializes the shared DateRangeParser (compiled regexes,
+timezone caches) once in the master process and forks it into workers.
+"""
+from src.app import app as application